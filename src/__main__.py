@@ -1,24 +1,44 @@
 import asyncio
 import sys
-from datetime import datetime
 
-from .app import MeetingApp
 from .config import require_api_key
 from .conversation_storage import ConversationData, SessionData, generate_session_id
 from .main_menu import show_main_menu
-from .model_manager import get_default_models
+from .model_manager import DEFAULT_MODELS
 from .models import AppConfig, MeetingSettings, NotesSummarizerConfig, PoeConfig
-from .setup_participants import SetupResult, run_participant_setup
 from .splash import display_splash_screen
+from .utils import utc_now_iso
+
+
+def _warm_up_imports() -> None:
+    """Load the modules deferred until a meeting starts (Textual, OpenAI)."""
+    try:
+        from . import app, setup_participants  # noqa: F401
+    except Exception:
+        # Any failure (not just ImportError) resurfaces from the real import
+        # when it's needed; the discarded executor future must never hold it
+        pass
 
 
 async def async_main() -> None:
     """Main entry point with menu-driven setup flow."""
     api_key = require_api_key()
 
+    # Run new tasks inline until their first suspension (Python 3.12+)
+    if hasattr(asyncio, "eager_task_factory"):
+        asyncio.get_running_loop().set_task_factory(asyncio.eager_task_factory)
+
+    # Import the meeting modules in the background while the splash runs,
+    # so starting a meeting later doesn't stall on them
+    asyncio.get_running_loop().run_in_executor(None, _warm_up_imports)
+
     # Display splash screen
     display_splash_screen(duration=3.0)
 
+    # Planning-assistant client, created on first use and kept for later
+    # setups so they reuse its connections
+    planning_client = None
+
     try:
         while True:
             # Show main menu
@@ -29,17 +49,22 @@ async def async_main() -> None:
 
             elif action == 'start_new':
                 # New meeting: Run participant design
-                available_models = (
-                    model_settings.available_models
-                    if model_settings.available_models
-                    else get_default_models()
+                from .setup_participants import (
+                    SetupResult,
+                    create_planning_client,
+                    run_participant_setup,
                 )
 
+                available_models = model_settings.available_models or DEFAULT_MODELS
+                if planning_client is None:
+                    planning_client = create_planning_client(api_key)
+
                 result, participants = await run_participant_setup(
                     meeting_config,
                     api_key,
                     available_models,
-                    model_settings.planning_assistant_model
+                    model_settings.planning_assistant_model,
+                    client=planning_client,
                 )
 
                 if result == SetupResult.SUCCESS and participants:
@@ -58,11 +83,12 @@ async def async_main() -> None:
                     )
 
                     # Create initial session data
+                    now = utc_now_iso()
                     initial_session = SessionData(
                         session_id=session_id,
                         title=meeting_config.title,
-                        created_at=datetime.utcnow().isoformat(),
-                        updated_at=datetime.utcnow().isoformat(),
+                        created_at=now,
+                        updated_at=now,
                         config=config,
                         conversation=ConversationData()
                     )
@@ -88,6 +114,9 @@ async def async_main() -> None:
 
     except KeyboardInterrupt:
         print("\n\n再見！\n")
+    finally:
+        if planning_client is not None:
+            await planning_client.close()
 
 
 async def run_meeting(
@@ -104,13 +133,22 @@ async def run_meeting(
         session_id: Unique session ID
         session_data: Complete session data (for save/restore)
     """
+    # Textual and the API client are only needed once a meeting starts
+    from .app import MeetingApp
+
     app = MeetingApp(config, api_key, session_id, session_data)
     await app.run_async()
 
 
 def main() -> None:
     """Entry point wrapper."""
-    asyncio.run(async_main())
+    try:
+        # Optional faster event loop (not available on Windows)
+        import uvloop
+    except ImportError:
+        asyncio.run(async_main())
+    else:
+        uvloop.run(async_main())
 
 
 if __name__ == "__main__":
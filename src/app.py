@@ -1,7 +1,7 @@
 from __future__ import annotations
 
 import asyncio
-from datetime import datetime
+from typing import TYPE_CHECKING
 
 from textual.app import App, ComposeResult
 from textual.binding import Binding
@@ -15,9 +15,26 @@ from .conversation_storage import (
     save_conversation,
 )
 from .models import AppConfig, ModeratorState
-from .moderator import Moderator
-from .poe_client import PoeClient
-from .utils import build_participant_labels
+from .utils import build_participant_labels, utc_now_iso
+
+if TYPE_CHECKING:
+    from .moderator import Moderator
+    from .poe_client import PoeClient
+
+# Number of characters of a streaming reply shown in the status bar
+_PREVIEW_CHARS = 80
+
+# Lines kept in the chat panel; older lines remain in the saved session only
+_CHAT_MAX_LINES = 1000
+
+WELCOME_BANNER = (
+    "歡迎來到 AI 會議室！\n\n"
+    "提示：\n"
+    "  • 在下方輸入框輸入訊息參與討論\n"
+    "  • 按 Ctrl+S 隨時儲存會議記錄\n"
+    "  • 按 Ctrl+Q 退出會議室（自動儲存）\n\n"
+    "────────────────────────────────────────────────────\n\n"
+)
 
 class MeetingApp(App):
     """Multi-AI Meeting Room TUI."""
@@ -43,12 +60,26 @@ class MeetingApp(App):
         self._session_id = session_id
         self._session_data = session_data
         self._poe: PoeClient | None = None
-        self._moderator: Moderator | None = None
-        self._streaming_buffer: str = ""
+        self._moderator: Moderator  # created in on_mount, before any input
+        self._streaming_chunks: list[str] = []
+        self._streaming_len: int = 0
         self._streaming_name: str | None = None
+        self._streaming_label: str = ""
         self._current_round: int = 0
-        # Build name→label lookup for display
+        self._notes_placeholder: bool = True
+        # Streaming previews and notes are coalesced and flushed on a timer
+        self._status_dirty: bool = False
+        self._pending_notes: list[str] = []
+        self._save_lock = asyncio.Lock()
+        self._sessions_linked: bool = False
+        # (chat messages, notes) already on disk; None until the first save
+        self._saved_counts: tuple[int, int] | None = (
+            self._content_counts() if session_data.conversation.chat_display else None
+        )
+        # Build name→label lookup for display (the moderator is shown as-is)
         self._labels: dict[str, str] = build_participant_labels(config.participants)
+        self._participants_line: str = ", ".join(self._labels.values())
+        self._labels["主持人"] = "主持人"
 
     def compose(self) -> ComposeResult:
         yield TextArea(
@@ -72,10 +103,17 @@ class MeetingApp(App):
         )
 
     def on_mount(self) -> None:
-        chat = self.query_one("#chat-panel", TextArea)
-        notes = self.query_one("#notes-panel", TextArea)
+        # Look widgets up once; callbacks below run many times per turn
+        self._chat_panel = chat = self.query_one("#chat-panel", TextArea)
+        self._notes_panel = notes = self.query_one("#notes-panel", TextArea)
+        self._status_bar = self.query_one("#status-bar", Static)
+        self._input_box = self.query_one("#input-box", Input)
         chat.border_title = f"Chat — {self._config.meeting.title}"
         notes.border_title = "會議記錄"
+        self.set_interval(1 / 30, self._flush_updates)
+
+        from .moderator import Moderator
+        from .poe_client import PoeClient
 
         self._poe = PoeClient(self._api_key, self._config)
         self._moderator = Moderator(
@@ -92,55 +130,52 @@ class MeetingApp(App):
             self._restore_conversation()
         else:
             # Show welcome message for new meeting
-            welcome = (
-                "歡迎來到 AI 會議室！\n\n"
-                "提示：\n"
-                "  • 在下方輸入框輸入訊息參與討論\n"
-                "  • 按 Ctrl+S 隨時儲存會議記錄\n"
-                "  • 按 Ctrl+Q 退出會議室（自動儲存）\n\n"
-                "────────────────────────────────────────────────────\n\n"
-            )
-            participants = ", ".join(
-                f"{p.name}（{p.role}, {p.model}）" for p in self._config.participants
-            )
-            chat.text = welcome + f"參與者：{participants}\n"
+            chat.text = WELCOME_BANNER + f"參與者：{self._participants_line}\n"
 
     def _restore_conversation(self) -> None:
         """Restore conversation from saved session."""
-        chat = self.query_one("#chat-panel", TextArea)
-        notes = self.query_one("#notes-panel", TextArea)
-
-        # Show welcome message
-        welcome = (
-            "歡迎來到 AI 會議室！\n\n"
-            "提示：\n"
-            "  • 在下方輸入框輸入訊息參與討論\n"
-            "  • 按 Ctrl+S 隨時儲存會議記錄\n"
-            "  • 按 Ctrl+Q 退出會議室（自動儲存）\n\n"
-            "────────────────────────────────────────────────────\n\n"
-        )
-
-        # Show participants
-        participants = ", ".join(
-            f"{p.name}（{p.role}, {p.model}）" for p in self._config.participants
+        chat = self._chat_panel
+        notes = self._notes_panel
+
+        # Show welcome message and participants
+        parts = [
+            WELCOME_BANNER,
+            f"參與者：{self._participants_line}\n\n",
+            "── 繼續先前的會議 ──\n",
+        ]
+
+        # Restore the newest chat messages that fit in the panel. The budget
+        # counts newlines: the panel shows one more line than that, and the
+        # truncation notice may need room too
+        notice = "\n（較早的訊息未顯示，仍保留在會議記錄檔中）\n"
+        recent: list[str] = []
+        budget = (
+            _CHAT_MAX_LINES - 1
+            - sum(part.count("\n") for part in parts)
+            - notice.count("\n")
         )
-        chat.text = welcome + f"參與者：{participants}\n\n"
-        chat.text += "── 繼續先前的會議 ──\n"
-
-        # Restore chat messages
-        for msg in self._session_data.conversation.chat_display:
+        for msg in reversed(self._session_data.conversation.chat_display):
             if msg.author == "使用者":
-                chat.text += f"\n【使用者】 {msg.text}\n"
+                part = f"\n【使用者】 {msg.text}\n"
             elif msg.author == "主持人":
-                chat.text += f"\n【主持人】 {msg.text}\n"
+                part = f"\n【主持人】 {msg.text}\n"
             else:
-                chat.text += f"\n【{msg.author}】\n{msg.text}\n"
+                part = f"\n【{msg.author}】\n{msg.text}\n"
+            budget -= part.count("\n")
+            if budget < 0:
+                parts.append(notice)
+                break
+            recent.append(part)
+        parts.extend(reversed(recent))
+        chat.text = "".join(parts)
 
         # Restore notes
         if self._session_data.conversation.notes:
-            notes.text = ""
-            for note in self._session_data.conversation.notes:
-                notes.text += f"\n=== 第 {note.round} 輪 ===\n{note.summary}\n"
+            self._notes_placeholder = False
+            notes.text = "".join(
+                f"\n=== 第 {note.round} 輪 ===\n{note.summary}\n"
+                for note in self._session_data.conversation.notes
+            )
             self._current_round = self._session_data.conversation.notes[-1].round
 
         # TODO: Restore participant session messages to moderator if needed
@@ -150,19 +185,18 @@ class MeetingApp(App):
         if not text:
             return
 
-        input_box = self.query_one("#input-box", Input)
+        input_box = self._input_box
         input_box.value = ""
         input_box.disabled = True
 
-        chat = self.query_one("#chat-panel", TextArea)
-        chat.text += f"\n【使用者】 {text}\n"
+        self._append_chat(f"\n【使用者】 {text}\n")
 
         # Save user message to session data
         self._session_data.conversation.chat_display.append(
             ConversationMessage(
                 author="使用者",
                 text=text,
-                timestamp=datetime.utcnow().isoformat()
+                timestamp=utc_now_iso()
             )
         )
 
@@ -174,60 +208,87 @@ class MeetingApp(App):
 
     async def _run_turn(self, text: str) -> None:
         try:
-            assert self._moderator is not None
             await self._moderator.handle_user_input(text)
         except asyncio.CancelledError:
             pass
         except Exception as exc:
-            notes = self.query_one("#notes-panel", TextArea)
-            notes.text += f"\n錯誤：{exc!s}"
+            self._pending_notes.append(f"錯誤：{exc!s}")
         finally:
-            input_box = self.query_one("#input-box", Input)
+            input_box = self._input_box
             input_box.disabled = False
             input_box.focus()
 
+    @staticmethod
+    def _append(area: TextArea, text: str) -> None:
+        """Append text at the end of a TextArea without rewriting the document."""
+        area.insert(text, area.document.end, maintain_selection_offset=False)
+
+    def _append_chat(self, text: str) -> None:
+        """Append to the chat panel, dropping the oldest lines past the cap."""
+        chat = self._chat_panel
+        self._append(chat, text)
+        excess = chat.document.line_count - _CHAT_MAX_LINES
+        if excess > 0:
+            chat.delete((0, 0), (excess, 0))
+
+    def _flush_updates(self) -> None:
+        """Write the latest streaming preview and any queued notes to the screen."""
+        if self._status_dirty:
+            self._status_dirty = False
+            preview = "".join(self._streaming_chunks)[:_PREVIEW_CHARS].replace("\n", " ")
+            self._status_bar.update(f"{self._streaming_label} 發言中：{preview}…")
+
+        if self._pending_notes:
+            text = "\n".join(self._pending_notes)
+            self._pending_notes.clear()
+            notes = self._notes_panel
+            if self._notes_placeholder:
+                self._notes_placeholder = False
+                notes.text = text
+            else:
+                self._append(notes, "\n" + text)
+
     # ---- Moderator callbacks ----
 
     async def _on_chat_message(self, author: str, text: str) -> None:
         """Called when an AI finishes speaking — write the complete message."""
-        chat = self.query_one("#chat-panel", TextArea)
+        label = self._labels.get(author, author)
         if author == "主持人":
-            label = "主持人"
-            chat.text += f"\n【主持人】 {text}\n"
+            self._append_chat(f"\n【主持人】 {text}\n")
         else:
-            label = self._labels.get(author, author)
-            chat.text += f"\n【{label}】\n{text}\n"
+            self._append_chat(f"\n【{label}】\n{text}\n")
 
         # Save to session data
         self._session_data.conversation.chat_display.append(
             ConversationMessage(
                 author=label,
                 text=text,
-                timestamp=datetime.utcnow().isoformat()
+                timestamp=utc_now_iso()
             )
         )
 
         self._streaming_name = None
-        self._streaming_buffer = ""
+        self._streaming_chunks.clear()
+        self._streaming_len = 0
+        self._status_dirty = False
 
     async def _on_chat_chunk(self, author: str, chunk: str) -> None:
         """Called for each streaming token. We accumulate and show progress
-        in the status bar since RichLog doesn't support partial writes."""
+        in the status bar since RichLog doesn't support partial writes.
+        The bar itself is refreshed by _flush_updates at most once per frame."""
         if self._streaming_name != author:
             self._streaming_name = author
-            self._streaming_buffer = ""
-        self._streaming_buffer += chunk
-        label = self._labels.get(author, author)
-        preview = self._streaming_buffer[:80].replace("\n", " ")
-        bar = self.query_one("#status-bar", Static)
-        bar.update(f"{label} 發言中：{preview}…")
+            self._streaming_label = self._labels.get(author, author)
+            self._streaming_chunks.clear()
+            self._streaming_len = 0
+        # Text past the preview length is never shown, so stop collecting it
+        if self._streaming_len < _PREVIEW_CHARS:
+            self._streaming_chunks.append(chunk)
+            self._streaming_len += len(chunk)
+            self._status_dirty = True
 
     async def _on_note(self, text: str) -> None:
-        notes = self.query_one("#notes-panel", TextArea)
-        if notes.text == "會議記錄將顯示在此…":
-            notes.text = text
-        else:
-            notes.text += "\n" + text
+        self._pending_notes.append(text)
 
         # Save to session data
         self._current_round += 1
@@ -235,12 +296,14 @@ class MeetingApp(App):
             NotesEntry(
                 round=self._current_round,
                 summary=text,
-                timestamp=datetime.utcnow().isoformat()
+                timestamp=utc_now_iso()
             )
         )
 
     async def _on_status(self, state: ModeratorState, detail: str) -> None:
-        bar = self.query_one("#status-bar", Static)
+        # Drop any queued streaming preview so it can't overwrite this state
+        self._status_dirty = False
+        bar = self._status_bar
         if state == ModeratorState.WAITING_FOR_USER:
             bar.update("就緒 — 輸入訊息繼續討論")
         else:
@@ -249,46 +312,72 @@ class MeetingApp(App):
 
     # ---- Save/Shutdown ----
 
-    def action_save_conversation(self) -> None:
+    async def action_save_conversation(self) -> None:
         """Save current conversation to disk."""
-        try:
-            # Update participant session data
-            self._update_session_data()
+        # Ignore repeated Ctrl+S while a save is still being written
+        if self._save_lock.locked():
+            return
 
-            # Save to disk
-            save_conversation(self._session_data)
-            self.notify("✓ 會議已儲存", severity="information", timeout=2)
-        except Exception as e:
-            self.notify(f"儲存失敗：{e}", severity="error")
+        async with self._save_lock:
+            try:
+                # Nothing new since the last save: the file is already current
+                counts = self._content_counts()
+                if counts != self._saved_counts:
+                    # Update participant session data
+                    self._update_session_data()
+
+                    # Save to disk without blocking the UI
+                    await asyncio.to_thread(save_conversation, self._session_data)
+                    self._saved_counts = counts
+                self.notify("✓ 會議已儲存", severity="information", timeout=2)
+            except Exception as e:
+                self.notify(f"儲存失敗：{e}", severity="error")
+
+    def _content_counts(self) -> tuple[int, int]:
+        """Return how many chat messages and notes the session holds.
+
+        Participant histories only grow alongside chat messages, so these
+        two counts are enough to tell whether anything needs saving.
+        """
+        conversation = self._session_data.conversation
+        return len(conversation.chat_display), len(conversation.notes)
 
     def _update_session_data(self) -> None:
         """Update session data with current moderator state."""
-        if not self._poe:
+        if not self._poe or self._sessions_linked:
             return
 
-        # Update participant sessions
-        participant_sessions = []
-        for name, session in self._poe.sessions.items():
-            participant_sessions.append(ParticipantSessionData(
+        # Link each participant's live message list once; every later save
+        # sees new messages through the shared list without rebuilding
+        self._session_data.conversation.participant_sessions = [
+            ParticipantSessionData.model_construct(
                 participant_name=name,
                 model=session.model,
-                messages=session.messages
-            ))
-
-        self._session_data.conversation.participant_sessions = participant_sessions
+                messages=session.messages,
+            )
+            for name, session in self._poe.sessions.items()
+        ]
+        self._sessions_linked = True
 
     async def action_request_quit(self) -> None:
         """Handle quit request - auto-save before exit."""
         # Auto-save on quit
         if self._session_data.conversation.chat_display:
-            try:
-                self._update_session_data()
-                save_conversation(self._session_data)
-            except Exception:
-                pass  # Silent fail on auto-save
-
-        if self._moderator:
-            self._moderator.request_shutdown()
+            async with self._save_lock:
+                counts = self._content_counts()
+                if counts != self._saved_counts:
+                    try:
+                        self._update_session_data()
+                        await asyncio.to_thread(save_conversation, self._session_data)
+                        self._saved_counts = counts
+                    except Exception:
+                        pass  # Silent fail on auto-save
+
+        # Ctrl+Q can arrive before on_mount has created the moderator, or
+        # after creating it failed
+        moderator = getattr(self, "_moderator", None)
+        if moderator is not None:
+            moderator.request_shutdown()
         if self._poe:
             await self._poe.close()
         self.exit()
@@ -1,14 +1,21 @@
 from __future__ import annotations
 
+import functools
 import os
 import sys
 
 from dotenv import load_dotenv
 
 
+@functools.lru_cache(maxsize=1)
 def require_api_key() -> str:
-    """Load .env and return POE_API_KEY, or exit with error."""
-    load_dotenv()
+    """Load .env and return POE_API_KEY, or exit with error.
+
+    The result is cached for the process; .env is only read when the
+    key isn't already set in the environment.
+    """
+    if not os.environ.get("POE_API_KEY", "").strip():
+        load_dotenv()
     key = os.environ.get("POE_API_KEY", "").strip()
     if not key:
         print(
@@ -2,17 +2,43 @@
 
 from __future__ import annotations
 
-from datetime import datetime
+import functools
+import heapq
+import operator
+import os
+import time
+from dataclasses import dataclass
+from datetime import datetime, timezone
 from pathlib import Path
-from typing import Optional
+from typing import Any, Optional
 
-import yaml
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, model_validator
 
 from .models import AppConfig
-
-
-class ConversationMessage(BaseModel):
+from .utils import (
+    atomic_write_bytes,
+    dump_json,
+    dump_model_json,
+    load_json,
+    load_yaml,
+    utc_now_iso,
+    yaml_safe_loader,
+)
+
+# Metadata rows for every saved session, kept in sync by save/delete
+_INDEX_FILE = "index.json"
+
+# Top-level scalars shown in the conversation list; a legacy YAML session's
+# message count comes from the length of conversation.chat_display
+_HEADER_KEYS = ("session_id", "title", "created_at", "updated_at")
+_HEADER_FIELDS = (*_HEADER_KEYS, "message_count")
+
+
+# Transcript entries are plain slotted dataclasses: there can be thousands
+# per session and they need no validation of their own. Pydantic still
+# validates and serializes them as fields of ConversationData.
+@dataclass(slots=True, frozen=True)
+class ConversationMessage:
     """A single message in the conversation display."""
     author: str  # "使用者" or participant name
     text: str
@@ -23,10 +49,13 @@ class ParticipantSessionData(BaseModel):
     """Saved session data for one participant."""
     participant_name: str
     model: str
-    messages: list[dict[str, str]]  # role + content
+    # role + content. Kept as plain dicts: these are the live histories the
+    # participants send to the API (shared, not copied, when saving)
+    messages: list[dict[str, str]]
 
 
-class NotesEntry(BaseModel):
+@dataclass(slots=True, frozen=True)
+class NotesEntry:
     """A single round's notes."""
     round: int
     summary: str
@@ -46,21 +75,52 @@ class SessionData(BaseModel):
     title: str
     created_at: str
     updated_at: str
+    updated_at_epoch_ns: int = 0  # Same moment as updated_at; 0 if saved by older versions
     config: AppConfig
     conversation: ConversationData
 
 
+def _iso_to_epoch_ns(value: str) -> int:
+    """Convert an ISO 8601 timestamp to Unix epoch nanoseconds.
+
+    Older versions saved naive UTC timestamps, so naive values are read as UTC.
+
+    Args:
+        value: ISO 8601 timestamp
+
+    Returns:
+        Nanoseconds since the epoch, or 0 if the value can't be parsed
+    """
+    try:
+        dt = datetime.fromisoformat(value)
+    except ValueError:
+        return 0
+    if dt.tzinfo is None:
+        dt = dt.replace(tzinfo=timezone.utc)
+    return int(dt.timestamp()) * 1_000_000_000 + dt.microsecond * 1_000
+
+
 class ConversationMetadata(BaseModel):
     """Metadata for conversation list."""
     session_id: str
     title: str
     created_at: str
     updated_at: str
+    updated_at_epoch_ns: int = 0  # Sort key
     message_count: int
 
+    @model_validator(mode="before")
+    @classmethod
+    def _fill_epoch_ns(cls, data: Any) -> Any:
+        """Derive the sort key from updated_at for sessions saved without it."""
+        if isinstance(data, dict) and not data.get("updated_at_epoch_ns") and "updated_at" in data:
+            data = {**data, "updated_at_epoch_ns": _iso_to_epoch_ns(data["updated_at"])}
+        return data
+
 
+@functools.lru_cache(maxsize=1)
 def get_conversations_dir() -> Path:
-    """Get the conversations storage directory."""
+    """Get the conversations storage directory (created on the first call)."""
     base_dir = Path.home() / ".ai_meeting_room"
     conv_dir = base_dir / "conversations"
     conv_dir.mkdir(parents=True, exist_ok=True)
@@ -73,6 +133,16 @@ def generate_session_id() -> str:
     return f"meeting_{timestamp}"
 
 
+def _write_session(file_path: Path, session_data: SessionData) -> None:
+    """Atomically write session data to a JSON file.
+
+    Args:
+        file_path: Destination path
+        session_data: Complete session data to write
+    """
+    atomic_write_bytes(file_path, dump_model_json(session_data))
+
+
 def save_conversation(session_data: SessionData) -> None:
     """Save conversation to disk.
 
@@ -80,18 +150,36 @@ def save_conversation(session_data: SessionData) -> None:
         session_data: Complete session data to save
     """
     conv_dir = get_conversations_dir()
-    file_path = conv_dir / f"{session_data.session_id}.yaml"
+    file_path = conv_dir / f"{session_data.session_id}.json"
 
     # Update timestamp
-    session_data.updated_at = datetime.utcnow().isoformat()
-
-    with open(file_path, 'w', encoding='utf-8') as f:
-        yaml.safe_dump(session_data.model_dump(), f, allow_unicode=True)
+    session_data.updated_at_epoch_ns = time.time_ns()
+    session_data.updated_at = utc_now_iso()
+
+    _write_session(file_path, session_data)
+    # The JSON file supersedes any copy saved in the old YAML format
+    (conv_dir / f"{session_data.session_id}.yaml").unlink(missing_ok=True)
+
+    index = _read_index(conv_dir)
+    if index is None:
+        index = _scan_conversations(conv_dir)  # Already includes this session
+    else:
+        index[session_data.session_id] = ConversationMetadata(
+            session_id=session_data.session_id,
+            title=session_data.title,
+            created_at=session_data.created_at,
+            updated_at=session_data.updated_at,
+            updated_at_epoch_ns=session_data.updated_at_epoch_ns,
+            message_count=len(session_data.conversation.chat_display),
+        )
+    _write_index(conv_dir, index)
 
 
 def load_conversation(session_id: str) -> Optional[SessionData]:
     """Load conversation from disk.
 
+    Sessions saved in the old YAML format are converted to JSON on first load.
+
     Args:
         session_id: Session ID to load
 
@@ -99,51 +187,252 @@ def load_conversation(session_id: str) -> Optional[SessionData]:
         SessionData or None if not found
     """
     conv_dir = get_conversations_dir()
-    file_path = conv_dir / f"{session_id}.yaml"
+    file_path = conv_dir / f"{session_id}.json"
+    legacy_path = conv_dir / f"{session_id}.yaml"
 
-    if not file_path.exists():
+    if not file_path.exists() and not legacy_path.exists():
         return None
 
     try:
-        with open(file_path, 'r', encoding='utf-8') as f:
-            data = yaml.safe_load(f)
-        return SessionData(**data)
+        if file_path.exists():
+            with open(file_path, 'rb') as f:
+                return SessionData(**load_json(f.read()))
+
+        # Saved by an older version in YAML
+        with open(legacy_path, 'r', encoding='utf-8') as f:
+            session_data = SessionData(**load_yaml(f))
     except Exception as e:
         print(f"載入會議時發生錯誤：{e}")
         return None
 
+    try:
+        _write_session(file_path, session_data)
+        legacy_path.unlink()
+    except OSError as e:
+        # Read-only or full home directory: use it unconverted
+        print(f"無法將會議轉存為新格式：{e}")
+    return session_data
+
+
+def _read_header(file_path: str) -> dict[str, Any]:
+    """Read the list metadata of a legacy YAML session.
 
-def list_conversations() -> list[ConversationMetadata]:
-    """List all saved conversations.
+    Walks the YAML event stream instead of constructing the document:
+    top-level header scalars are captured, and the entries of
+    conversation.chat_display are counted without being built. Stops as
+    soon as every field is known.
+
+    Args:
+        file_path: Session file to read
 
     Returns:
-        List of conversation metadata, sorted by updated_at (newest first)
+        Raw scalar values keyed by field name (may be incomplete)
     """
-    conv_dir = get_conversations_dir()
-    conversations = []
+    import yaml  # Only legacy sessions need it, so not imported at startup
+
+    header: dict[str, Any] = {}
+    # One slot per open collection: the mapping key whose value is being
+    # read, or None while waiting for the next key (always None in sequences)
+    keys: list[Optional[str]] = []
+    is_mapping: list[bool] = []
+    count_depth = 0  # Nesting depth of the chat_display sequence, once found
+    count = 0
+
+    with open(file_path, 'r', encoding='utf-8') as f:
+        for event in yaml.parse(f, Loader=yaml_safe_loader()):
+            if isinstance(event, yaml.CollectionEndEvent):
+                if len(keys) == count_depth:
+                    header["message_count"] = count
+                    count_depth = 0
+                keys.pop()
+                is_mapping.pop()
+                if keys:
+                    keys[-1] = None  # The enclosing value is complete
+            elif isinstance(event, yaml.NodeEvent):
+                if is_mapping and is_mapping[-1] and keys[-1] is None:
+                    if not isinstance(event, yaml.ScalarEvent):
+                        break  # Complex keys never appear in saved sessions
+                    keys[-1] = event.value
+                    continue
+
+                if count_depth and len(keys) == count_depth:
+                    count += 1
+
+                if isinstance(event, yaml.CollectionStartEvent):
+                    if (
+                        keys == ["conversation", "chat_display"]
+                        and isinstance(event, yaml.SequenceStartEvent)
+                    ):
+                        count_depth = 3
+                    keys.append(None)
+                    is_mapping.append(isinstance(event, yaml.MappingStartEvent))
+                    continue
+
+                if len(keys) == 1 and keys[0] in _HEADER_KEYS and isinstance(event, yaml.ScalarEvent):
+                    header[keys[0]] = event.value
+                if is_mapping[-1]:
+                    keys[-1] = None
+
+            if len(header) == len(_HEADER_FIELDS):
+                break
+
+    return header
+
+
+def _metadata_from_dict(data: dict[str, Any]) -> ConversationMetadata:
+    """Extract list metadata from a fully loaded session document.
 
-    for file_path in conv_dir.glob("*.yaml"):
+    Args:
+        data: Session data as loaded from disk
+
+    Returns:
+        Conversation metadata
+    """
+    return ConversationMetadata(
+        session_id=data["session_id"],
+        title=data["title"],
+        created_at=data["created_at"],
+        updated_at=data["updated_at"],
+        updated_at_epoch_ns=data.get("updated_at_epoch_ns", 0),
+        message_count=len(data.get("conversation", {}).get("chat_display", []))
+    )
+
+
+def _scan_conversations(conv_dir: Path) -> dict[str, ConversationMetadata]:
+    """Build metadata for every session file by reading the files themselves.
+
+    Args:
+        conv_dir: Conversations directory
+
+    Returns:
+        Conversation metadata keyed by session ID
+    """
+    conversations: dict[str, ConversationMetadata] = {}
+
+    # os.scandir avoids building a Path per entry and caches the file type
+    with os.scandir(conv_dir) as it:
+        entries = [
+            entry for entry in it
+            if entry.name.endswith((".json", ".yaml"))
+            and entry.name != _INDEX_FILE
+            and entry.is_file()
+        ]
+
+    for entry in entries:
         try:
-            with open(file_path, 'r', encoding='utf-8') as f:
-                data = yaml.safe_load(f)
-
-            metadata = ConversationMetadata(
-                session_id=data["session_id"],
-                title=data["title"],
-                created_at=data["created_at"],
-                updated_at=data["updated_at"],
-                message_count=len(data.get("conversation", {}).get("chat_display", []))
-            )
-            conversations.append(metadata)
+            if entry.name.endswith(".json"):
+                with open(entry.path, 'rb') as f:
+                    metadata = _metadata_from_dict(load_json(f.read()))
+            else:
+                header = _read_header(entry.path)
+                if len(header) == len(_HEADER_FIELDS):
+                    metadata = ConversationMetadata(**header)
+                else:
+                    # Unexpected layout: fall back to loading the whole file
+                    with open(entry.path, 'rb') as f:
+                        metadata = _metadata_from_dict(load_yaml(f.read()))
         except Exception as e:
-            print(f"讀取 {file_path} 時發生錯誤：{e}")
+            print(f"讀取 {entry.path} 時發生錯誤：{e}")
             continue
 
-    # Sort by updated_at, newest first
-    conversations.sort(key=lambda x: x.updated_at, reverse=True)
+        if entry.name.endswith(".json"):
+            conversations[metadata.session_id] = metadata
+        else:
+            # A JSON copy of the same session is newer than the legacy file
+            conversations.setdefault(metadata.session_id, metadata)
+
     return conversations
 
 
+@functools.lru_cache(maxsize=4)
+def _load_index(
+    index_path: Path, fingerprint: tuple[int, int]
+) -> Optional[dict[str, ConversationMetadata]]:
+    """Parse the conversations index, memoized on its (mtime_ns, size).
+
+    Args:
+        index_path: Path to the index file
+        fingerprint: Modification time and size of the index file
+
+    Returns:
+        Conversation metadata keyed by session ID, or None if unreadable
+    """
+    try:
+        with open(index_path, 'rb') as f:
+            rows = load_json(f.read())
+        return {
+            row["session_id"]: ConversationMetadata.model_validate(row)
+            for row in rows
+        }
+    except (OSError, ValueError, TypeError, KeyError):
+        return None
+
+
+def _read_index(conv_dir: Path) -> Optional[dict[str, ConversationMetadata]]:
+    """Load the conversations index.
+
+    Reuses the previous parse while the file's mtime and size are unchanged.
+
+    Args:
+        conv_dir: Conversations directory
+
+    Returns:
+        Conversation metadata keyed by session ID, or None if the index is
+        missing or unreadable
+    """
+    index_path = conv_dir / _INDEX_FILE
+    try:
+        stat = index_path.stat()
+    except OSError:
+        return None
+
+    index = _load_index(index_path, (stat.st_mtime_ns, stat.st_size))
+    # Callers modify the result, so hand out a copy of the cached mapping
+    return dict(index) if index is not None else None
+
+
+def _write_index(conv_dir: Path, conversations: dict[str, ConversationMetadata]) -> None:
+    """Atomically replace the conversations index.
+
+    Args:
+        conv_dir: Conversations directory
+        conversations: Conversation metadata keyed by session ID
+    """
+    atomic_write_bytes(
+        conv_dir / _INDEX_FILE,
+        dump_json([metadata.model_dump() for metadata in conversations.values()]),
+    )
+    _load_index.cache_clear()
+
+
+def list_conversations(limit: Optional[int] = None) -> list[ConversationMetadata]:
+    """List saved conversations.
+
+    Args:
+        limit: Only return the most recently updated conversations, or None
+            for all of them
+
+    Returns:
+        List of conversation metadata, sorted by updated_at (newest first)
+    """
+    conv_dir = get_conversations_dir()
+
+    index = _read_index(conv_dir)
+    if index is None:
+        # First run or damaged index: rebuild it from the session files
+        index = _scan_conversations(conv_dir)
+        try:
+            _write_index(conv_dir, index)
+        except OSError:
+            pass  # Listing still works; the next save will retry
+
+    # Sort by update time, newest first (integer keys, not ISO strings)
+    by_updated = operator.attrgetter("updated_at_epoch_ns")
+    if limit is not None:
+        return heapq.nlargest(limit, index.values(), key=by_updated)
+    return sorted(index.values(), key=by_updated, reverse=True)
+
+
 def delete_conversation(session_id: str) -> bool:
     """Delete a conversation.
 
@@ -154,9 +443,15 @@ def delete_conversation(session_id: str) -> bool:
         True if deleted, False if not found
     """
     conv_dir = get_conversations_dir()
-    file_path = conv_dir / f"{session_id}.yaml"
+    paths = [conv_dir / f"{session_id}.json", conv_dir / f"{session_id}.yaml"]
+    existing = [path for path in paths if path.exists()]
+
+    if existing:
+        for path in existing:
+            path.unlink()
 
-    if file_path.exists():
-        file_path.unlink()
+        index = _read_index(conv_dir)
+        if index is not None and index.pop(session_id, None) is not None:
+            _write_index(conv_dir, index)
         return True
     return False
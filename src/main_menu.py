@@ -1,26 +1,33 @@
 """Main menu for AI Meeting Room."""
 
+import functools
 import os
-from datetime import datetime
 from pathlib import Path
 from typing import Optional
 
-import yaml
 from pydantic import ValidationError
 
 from .conversation_storage import SessionData
 from .meeting_settings import display_meeting_settings, get_default_meeting_config, manage_meeting_settings
-from .model_manager import get_default_models
+from .model_manager import DEFAULT_MODELS, get_default_models
 from .model_settings import display_model_settings, manage_model_settings
-from .models import BasicMeetingConfig, ModelSettings, UserPreferences
+from .models import PREFERENCES_SCHEMA_VERSION, BasicMeetingConfig, ModelSettings, UserPreferences
 from .ui_helpers import clear_screen, confirm_yes_no, wait_for_enter
+from .utils import atomic_write_bytes, dump_model_json, load_json, load_yaml, utc_now_iso
 
 
+@functools.lru_cache(maxsize=1)
 def get_preferences_path() -> Path:
-    """Get the path to user preferences file."""
+    """Get the path to user preferences file (its directory is created on the first call)."""
     config_dir = Path.home() / ".ai_meeting_room"
     config_dir.mkdir(exist_ok=True)
-    return config_dir / "preferences.yaml"
+    return config_dir / "preferences.json"
+
+
+@functools.lru_cache(maxsize=1)
+def _default_model_settings() -> ModelSettings:
+    """Get default model settings, validated once and shared (copy before modifying)."""
+    return ModelSettings(available_models=get_default_models())
 
 
 def load_preferences() -> tuple[BasicMeetingConfig, ModelSettings]:
@@ -30,34 +37,68 @@ def load_preferences() -> tuple[BasicMeetingConfig, ModelSettings]:
         Tuple of (BasicMeetingConfig, ModelSettings)
     """
     prefs_path = get_preferences_path()
+    legacy_path = prefs_path.with_suffix(".yaml")
 
-    if not prefs_path.exists():
+    if not prefs_path.exists() and not legacy_path.exists():
         # First run: initialize with actual default models
-        model_settings = ModelSettings()
-        model_settings.available_models = get_default_models()
-        return get_default_meeting_config(), model_settings
+        return (
+            get_default_meeting_config().model_copy(),
+            _default_model_settings().model_copy(deep=True),
+        )
 
     try:
-        with open(prefs_path, 'r', encoding='utf-8') as f:
-            data = yaml.safe_load(f)
+        if prefs_path.exists():
+            with open(prefs_path, 'rb') as f:
+                data = load_json(f.read())
+        else:
+            # Saved by an older version in YAML
+            with open(legacy_path, 'r', encoding='utf-8') as f:
+                data = load_yaml(f)
 
         prefs = UserPreferences(**data)
 
-        # Migrate old custom_models to model_settings.available_models
-        if prefs.custom_models and not prefs.model_settings.available_models:
-            prefs.model_settings.available_models = prefs.custom_models
+        if data.get("schema_version") != PREFERENCES_SCHEMA_VERSION or not prefs_path.exists():
+            # Written by an older version: migrate once and save in the
+            # current format, so later launches skip this block
 
-        # Migrate empty available_models to actual defaults
-        if not prefs.model_settings.available_models:
-            prefs.model_settings.available_models = get_default_models()
+            # Migrate old custom_models to model_settings.available_models
+            if prefs.custom_models and not prefs.model_settings.available_models:
+                prefs.model_settings.available_models = prefs.custom_models
+
+            # Migrate empty available_models to actual defaults
+            if not prefs.model_settings.available_models:
+                prefs.model_settings.available_models = get_default_models()
+
+            prefs.schema_version = PREFERENCES_SCHEMA_VERSION
+            try:
+                atomic_write_bytes(prefs_path, dump_model_json(prefs))
+                # Also converts preferences saved in the old YAML format to JSON
+                legacy_path.unlink(missing_ok=True)
+            except OSError:
+                pass  # Read-only or full home directory: use them unsaved
 
         return prefs.basic_config, prefs.model_settings
 
-    except (ValidationError, yaml.YAMLError, KeyError, TypeError):
+    except (ValidationError, ValueError, KeyError, TypeError):
         # Corrupted or invalid preferences file
-        model_settings = ModelSettings()
-        model_settings.available_models = get_default_models()
-        return get_default_meeting_config(), model_settings
+        return (
+            get_default_meeting_config().model_copy(),
+            _default_model_settings().model_copy(deep=True),
+        )
+
+
+def read_saved_model_settings() -> Optional[ModelSettings]:
+    """Read the model settings currently stored in the preferences file.
+
+    Returns:
+        The stored ModelSettings, or None if the file is missing or can't be
+        loaded (load_preferences falls back to defaults in that case)
+    """
+    try:
+        with open(get_preferences_path(), 'rb') as f:
+            return UserPreferences(**load_json(f.read())).model_settings
+    except (OSError, ValidationError, ValueError, KeyError, TypeError):
+        return None
 
 
 def save_preferences(meeting_config: BasicMeetingConfig, model_settings: ModelSettings) -> None:
@@ -70,28 +111,29 @@ def save_preferences(meeting_config: BasicMeetingConfig, model_settings: ModelSe
     prefs = UserPreferences(
         basic_config=meeting_config,
         model_settings=model_settings,
-        saved_at=datetime.utcnow().isoformat()
+        saved_at=utc_now_iso()
     )
 
-    prefs_path = get_preferences_path()
-    with open(prefs_path, 'w', encoding='utf-8') as f:
-        yaml.safe_dump(prefs.model_dump(), f, allow_unicode=True)
+    atomic_write_bytes(get_preferences_path(), dump_model_json(prefs))
 
 
 def display_main_menu() -> None:
     """Display the main menu."""
-    print("\n" + "=" * 60)
-    print("  AI 會議室")
-    print("=" * 60)
-    print("\n主選單：")
-    print("  1 - 新會議")
-    print("  2 - 載入會議")
-    print("  3 - 管理會議記錄")
-    print("  4 - 模型設定")
-    print("  5 - 會議設定")
-    print("  v - 檢視目前設定")
-    print("  q - 離開")
-    print()
+    # Each screen is written with a single print() rather than one per line
+    print("\n".join([
+        "\n" + "=" * 60,
+        "  AI 會議室",
+        "=" * 60,
+        "\n主選單：",
+        "  1 - 新會議",
+        "  2 - 載入會議",
+        "  3 - 管理會議記錄",
+        "  4 - 模型設定",
+        "  5 - 會議設定",
+        "  v - 檢視目前設定",
+        "  q - 離開",
+        "",
+    ]))
 
 
 def display_current_config(meeting_config: BasicMeetingConfig, model_settings: ModelSettings) -> None:
@@ -101,25 +143,24 @@ def display_current_config(meeting_config: BasicMeetingConfig, model_settings: M
         meeting_config: Meeting configuration
         model_settings: Model settings
     """
-    print("\n" + "=" * 60)
-    print("  目前設定")
-    print("=" * 60)
-
-    # Meeting settings
-    print("\n會議設定：")
-    print(f"  標題：{meeting_config.title}")
-    print(f"  每輪最大回合數：{meeting_config.max_rounds_per_turn}")
-    print(f"  相關性逾時：{meeting_config.relevance_timeout_seconds}s")
-    print(f"  回應逾時：{meeting_config.response_timeout_seconds}s")
-
-    # Model settings
-    available = model_settings.available_models if model_settings.available_models else get_default_models()
-    print("\n模型設定：")
-    print(f"  規劃助手：{model_settings.planning_assistant_model}")
-    print(f"  會議記錄：{model_settings.notes_model}")
-    print(f"  可用模型：已配置 {len(available)} 個模型")
-
-    print("=" * 60 + "\n")
+    available = model_settings.available_models or DEFAULT_MODELS
+    print("\n".join([
+        "\n" + "=" * 60,
+        "  目前設定",
+        "=" * 60,
+        # Meeting settings
+        "\n會議設定：",
+        f"  標題：{meeting_config.title}",
+        f"  每輪最大回合數：{meeting_config.max_rounds_per_turn}",
+        f"  相關性逾時：{meeting_config.relevance_timeout_seconds}s",
+        f"  回應逾時：{meeting_config.response_timeout_seconds}s",
+        # Model settings
+        "\n模型設定：",
+        f"  規劃助手：{model_settings.planning_assistant_model}",
+        f"  會議記錄：{model_settings.notes_model}",
+        f"  可用模型：已配置 {len(available)} 個模型",
+        "=" * 60 + "\n",
+    ]))
 
 
 def manage_conversations_menu() -> None:
@@ -139,17 +180,19 @@ def manage_conversations_menu() -> None:
             wait_for_enter()
             return
 
-        print("\n已儲存的會議：")
-        for i, conv in enumerate(conversations, 1):
-            print(f"  {i}. {conv.title}")
-            print(f"     建立時間：{conv.created_at[:19]}")
-            print(f"     更新時間：{conv.updated_at[:19]}")
-            print(f"     訊息數：{conv.message_count}")
-            print()
-
-        print("指令：")
-        print("  <數字> - 刪除會議")
-        print("  b - 返回主選單")
+        print("\n".join([
+            "\n已儲存的會議：",
+            *(
+                f"  {i}. {conv.title}\n"
+                f"     建立時間：{conv.created_at[:19]}\n"
+                f"     更新時間：{conv.updated_at[:19]}\n"
+                f"     訊息數：{conv.message_count}\n"
+                for i, conv in enumerate(conversations, 1)
+            ),
+            "指令：",
+            "  <數字> - 刪除會議",
+            "  b - 返回主選單",
+        ]))
 
         cmd = input("\n指令：").strip().lower()
 
@@ -222,14 +265,18 @@ def show_main_menu() -> tuple[str, BasicMeetingConfig, ModelSettings, Optional[S
                     wait_for_enter()
                     continue
 
-                print("\n" + "=" * 60)
-                print("  載入會議")
-                print("=" * 60)
-                print("\n已儲存的會議：")
-                for i, conv in enumerate(conversations, 1):
-                    print(f"  {i}. {conv.title}")
-                    print(f"     最後更新：{conv.updated_at[:19]}")
-                    print(f"     訊息數：{conv.message_count}")
+                print("\n".join([
+                    "\n" + "=" * 60,
+                    "  載入會議",
+                    "=" * 60,
+                    "\n已儲存的會議：",
+                    *(
+                        f"  {i}. {conv.title}\n"
+                        f"     最後更新：{conv.updated_at[:19]}\n"
+                        f"     訊息數：{conv.message_count}"
+                        for i, conv in enumerate(conversations, 1)
+                    ),
+                ]))
 
                 choice = input("\n輸入數字載入（或按 Enter 取消）：").strip()
                 if not choice:
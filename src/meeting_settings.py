@@ -1,5 +1,6 @@
 """Meeting settings configuration."""
 
+import functools
 from typing import Optional
 
 from .models import BasicMeetingConfig, ModelSettings
@@ -26,9 +27,12 @@ def auto_save_meeting_settings(
     wait_for_enter()
 
 
+@functools.lru_cache(maxsize=1)
 def get_default_meeting_config() -> BasicMeetingConfig:
     """Get default meeting configuration.
 
+    The instance is built once and shared; use model_copy() before modifying it.
+
     Returns:
         BasicMeetingConfig with default values
     """
@@ -202,25 +206,27 @@ def manage_meeting_settings(
     Returns:
         Updated BasicMeetingConfig
     """
-    config = current_config.model_copy() if current_config else get_default_meeting_config()
+    config = (current_config or get_default_meeting_config()).model_copy()
 
     def show_meeting_settings_menu():
         """Display meeting settings menu."""
-        print("\n" + "=" * 60)
-        print("  會議設定")
-        print("=" * 60)
-        print("\n目前設定：")
-        print(f"  標題：{config.title}")
-        print(f"  每輪最大回合數：{config.max_rounds_per_turn}")
-        print(f"  相關性逾時：{config.relevance_timeout_seconds}s")
-        print(f"  回應逾時：{config.response_timeout_seconds}s")
-        print("\n指令：")
-        print("  1 - 設定每輪最大回合數")
-        print("  2 - 設定相關性逾時")
-        print("  3 - 設定回應逾時")
-        print("  d - 重設為預設值")
-        print("  v - 檢視目前設定")
-        print("  b - 返回主選單\n")
+        print("\n".join([
+            "\n" + "=" * 60,
+            "  會議設定",
+            "=" * 60,
+            "\n目前設定：",
+            f"  標題：{config.title}",
+            f"  每輪最大回合數：{config.max_rounds_per_turn}",
+            f"  相關性逾時：{config.relevance_timeout_seconds}s",
+            f"  回應逾時：{config.response_timeout_seconds}s",
+            "\n指令：",
+            "  1 - 設定每輪最大回合數",
+            "  2 - 設定相關性逾時",
+            "  3 - 設定回應逾時",
+            "  d - 重設為預設值",
+            "  v - 檢視目前設定",
+            "  b - 返回主選單\n",
+        ]))
 
     while True:
         clear_screen()
@@ -259,7 +265,7 @@ def manage_meeting_settings(
         elif cmd == 'd':
             clear_screen()
             if confirm_yes_no("\n確定重設所有會議設定為預設值？", default_yes=False):
-                config = get_default_meeting_config()
+                config = get_default_meeting_config().model_copy()
                 print("\n  ✓ 已重設為預設值")
                 # Auto-save
                 auto_save_meeting_settings(config, model_settings)
@@ -1,11 +1,13 @@
 """Model management for AI Meeting Room."""
 
+import functools
+from collections.abc import Sequence
 from typing import Optional
 
 from .ui_helpers import clear_screen
 
-# Default models based on Poe API
-DEFAULT_MODELS = [
+# Default models based on Poe API (a tuple so read-only callers can share it)
+DEFAULT_MODELS = (
     # OpenAI models
     "gpt-5.2",
     "gpt-4o",
@@ -29,21 +31,38 @@ DEFAULT_MODELS = [
     "deepseek-r1",
     "llama-4-maverick-t",
     "qwen3-max",
-]
+)
 
 
-def display_models(models: list[str]) -> None:
+def display_models(models: Sequence[str]) -> None:
     """Display available models in a formatted list.
 
     Args:
         models: List of model names
     """
-    print("\n可用 AI 模型：")
-    print("-" * 50)
-    for i, model in enumerate(models, 1):
-        print(f"  {i:2d}. {model}")
-    print("-" * 50)
-    print(f"共 {len(models)} 個模型\n")
+    print(render_models(tuple(models)))
+
+
+@functools.lru_cache(maxsize=32)
+def render_models(models: tuple[str, ...]) -> str:
+    """Render the model list shown by display_models.
+
+    Cached on the (hashable) tuple of names, since the same list is shown
+    repeatedly while browsing the settings menus.
+
+    Args:
+        models: Model names
+
+    Returns:
+        The formatted list as a single string
+    """
+    return "\n".join([
+        "\n可用 AI 模型：",
+        "-" * 50,
+        *(f"  {i:2d}. {model}" for i, model in enumerate(models, 1)),
+        "-" * 50,
+        f"共 {len(models)} 個模型\n",
+    ])
 
 
 def add_model_interactive(current_models: list[str]) -> list[str]:
@@ -62,7 +81,9 @@ def add_model_interactive(current_models: list[str]) -> list[str]:
     print("參考：https://poe.com/api/models")
     print("輸入空行結束新增。\n")
 
-    models = current_models.copy()
+    # Drop any existing duplicates (keeping order); the set gives O(1) lookups
+    models = list(dict.fromkeys(current_models))
+    seen = set(models)
 
     while True:
         model_name = input("模型名稱（或按 Enter 結束）：").strip()
@@ -70,11 +91,12 @@ def add_model_interactive(current_models: list[str]) -> list[str]:
         if not model_name:
             break
 
-        if model_name in models:
+        if model_name in seen:
             print(f"  ⚠️  '{model_name}' 已在清單中。")
             continue
 
         models.append(model_name)
+        seen.add(model_name)
         print(f"  ✓ 已新增 '{model_name}'")
 
     return models
@@ -128,7 +150,7 @@ def manage_models_interactive(current_models: Optional[list[str]] = None) -> lis
     Returns:
         Final list of models
     """
-    models = current_models.copy() if current_models else DEFAULT_MODELS.copy()
+    models = current_models.copy() if current_models else list(DEFAULT_MODELS)
 
     print("\n" + "=" * 60)
     print("  模型管理")
@@ -152,7 +174,7 @@ def manage_models_interactive(current_models: Optional[list[str]] = None) -> lis
         elif cmd == 'r':
             models = remove_model_interactive(models)
         elif cmd == 'd':
-            models = DEFAULT_MODELS.copy()
+            models = list(DEFAULT_MODELS)
             print("  ✓ 已重設為預設模型")
             display_models(models)
         elif cmd == 's':
@@ -163,15 +185,17 @@ def manage_models_interactive(current_models: Optional[list[str]] = None) -> lis
             return models
         elif cmd == 'q':
             print("\n  已取消模型變更。\n")
-            return current_models if current_models else DEFAULT_MODELS.copy()
+            return current_models if current_models else list(DEFAULT_MODELS)
         else:
             print("  ❌ 未知的指令。請使用：v、a、r、d、s 或 q")
 
 
 def get_default_models() -> list[str]:
-    """Get default model list.
+    """Get a fresh, modifiable copy of the default model list.
+
+    Callers that only read the defaults should use DEFAULT_MODELS directly.
 
     Returns:
         List of default model names
     """
-    return DEFAULT_MODELS.copy()
+    return list(DEFAULT_MODELS)
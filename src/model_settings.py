@@ -16,14 +16,23 @@ from .ui_helpers import clear_screen, wait_for_enter
 def auto_save_model_settings(
     settings: ModelSettings,
     available: list[str],
-    meeting_config: BasicMeetingConfig
-) -> None:
+    meeting_config: BasicMeetingConfig,
+    last_saved: Optional[ModelSettings] = None,
+) -> ModelSettings:
     """Auto-save model settings to disk.
 
+    Actions that leave the settings as they were (keeping the current model,
+    adding nothing, ...) don't rewrite the preferences file.
+
     Args:
         settings: Current model settings
         available: Current available models list
         meeting_config: Meeting config (needed for save_preferences)
+        last_saved: Settings as stored on disk, or None if nothing valid is
+            stored yet
+
+    Returns:
+        Snapshot of the settings now on disk, to pass back in next time
     """
     from .main_menu import save_preferences
 
@@ -31,11 +40,14 @@ def auto_save_model_settings(
     settings.available_models = available
 
     # Save to disk
-    save_preferences(meeting_config, settings)
+    if settings != last_saved:
+        save_preferences(meeting_config, settings)
+        last_saved = settings.model_copy(deep=True)
 
-    # Show feedback
-    print("  ✓ 已儲存")
-    wait_for_enter()
+        # Show feedback
+        print("  ✓ 已儲存")
+        wait_for_enter()
+    return last_saved
 
 
 def display_model_settings(settings: ModelSettings) -> None:
@@ -44,7 +56,7 @@ def display_model_settings(settings: ModelSettings) -> None:
     Args:
         settings: ModelSettings object
     """
-    available = settings.available_models if settings.available_models else get_default_models()
+    available = settings.available_models or DEFAULT_MODELS
 
     print("\n" + "=" * 60)
     print("  目前模型設定")
@@ -125,22 +137,29 @@ def manage_model_settings(
 
     # Use available models or defaults
     available = settings.available_models if settings.available_models else get_default_models()
+    # What's on disk, so unchanged auto-saves can be skipped; None on first
+    # run or when the file is unreadable, so the first auto-save writes
+    from .main_menu import read_saved_model_settings
+
+    saved = read_saved_model_settings()
 
     def show_model_settings_menu():
         """Display model settings menu."""
-        print("\n" + "=" * 60)
-        print("  模型設定")
-        print("=" * 60)
-        print("\n目前設定：")
-        print(f"  規劃助手：{settings.planning_assistant_model}")
-        print(f"  會議記錄：{settings.notes_model}")
-        print(f"  可用模型：已配置 {len(available)} 個")
-        print("\n指令：")
-        print("  1 - 設定規劃助手模型（參與者設計）")
-        print("  2 - 設定會議記錄模型")
-        print("  3 - 管理可用模型（新增/移除）")
-        print("  v - 檢視目前設定")
-        print("  b - 返回主選單\n")
+        print("\n".join([
+            "\n" + "=" * 60,
+            "  模型設定",
+            "=" * 60,
+            "\n目前設定：",
+            f"  規劃助手：{settings.planning_assistant_model}",
+            f"  會議記錄：{settings.notes_model}",
+            f"  可用模型：已配置 {len(available)} 個",
+            "\n指令：",
+            "  1 - 設定規劃助手模型（參與者設計）",
+            "  2 - 設定會議記錄模型",
+            "  3 - 管理可用模型（新增/移除）",
+            "  v - 檢視目前設定",
+            "  b - 返回主選單\n",
+        ]))
 
     while True:
         clear_screen()
@@ -159,7 +178,9 @@ def manage_model_settings(
                 available
             )
             # Auto-save
-            auto_save_model_settings(settings, available, meeting_config)
+            saved = auto_save_model_settings(
+                settings, available, meeting_config, saved
+            )
 
         elif cmd == '2':
             settings.notes_model = select_model_from_list(
@@ -168,7 +189,9 @@ def manage_model_settings(
                 available
             )
             # Auto-save
-            auto_save_model_settings(settings, available, meeting_config)
+            saved = auto_save_model_settings(
+                settings, available, meeting_config, saved
+            )
 
         elif cmd == '3':
             def show_manage_models_menu():
@@ -199,20 +222,26 @@ def manage_model_settings(
                     print(f"\n  ✓ 模型已更新")
                     wait_for_enter()
                     # Auto-save
-                    auto_save_model_settings(settings, available, meeting_config)
+                    saved = auto_save_model_settings(
+                        settings, available, meeting_config, saved
+                    )
                 elif sub_cmd == 'r':
                     available = remove_model_interactive(available)
                     print(f"\n  ✓ 模型已更新")
                     wait_for_enter()
                     # Auto-save
-                    auto_save_model_settings(settings, available, meeting_config)
+                    saved = auto_save_model_settings(
+                        settings, available, meeting_config, saved
+                    )
                 elif sub_cmd == 'd':
                     clear_screen()
                     available = get_default_models()
                     print("\n  ✓ 已重設為預設模型")
                     wait_for_enter()
                     # Auto-save
-                    auto_save_model_settings(settings, available, meeting_config)
+                    saved = auto_save_model_settings(
+                        settings, available, meeting_config, saved
+                    )
                 elif sub_cmd == 'v':
                     clear_screen()
                     display_models(available)
@@ -36,8 +36,13 @@ class ModelSettings(BaseModel):
     available_models: list[str] = []  # Will be populated with defaults on first load
 
 
+# Bump when saved preferences need migrating in load_preferences
+PREFERENCES_SCHEMA_VERSION = 1
+
+
 class UserPreferences(BaseModel):
     """User preferences saved to disk."""
+    schema_version: int = PREFERENCES_SCHEMA_VERSION
     basic_config: BasicMeetingConfig
     model_settings: ModelSettings = ModelSettings()
     # Deprecated field for backward compatibility
@@ -1,12 +1,13 @@
 from __future__ import annotations
 
 import asyncio
-from collections.abc import Callable, Coroutine
+import re
+from collections.abc import Awaitable, Callable, Coroutine, Iterable
 from typing import Any
 
 from .models import AppConfig, ModeratorState, RelevanceResult
 from .notes import NotesManager
-from .poe_client import PoeClient
+from .poe_client import ParticipantSession, PoeClient
 from .utils import build_participant_labels, format_relevance_result, sort_speakers
 
 # Callback signatures (all are async)
@@ -15,6 +16,15 @@ OnChatChunk = Callable[[str, str], Coroutine[Any, Any, None]]     # (author, chu
 OnNote = Callable[[str], Coroutine[Any, Any, None]]               # (note text)
 OnStatus = Callable[[ModeratorState, str], Coroutine[Any, Any, None]]  # (state, detail)
 
+# Bare thank-yous that no participant needs to answer; these skip the
+# relevance round entirely instead of costing one API call per participant.
+# Affirmatives (ok, 好, 了解, ...) are left out: like a bare yes, they often
+# answer a participant's question
+_TRIVIAL_RE = re.compile(
+    r"^(thanks?( you)?|thx|謝謝|多謝|感謝)[\W_]*$",
+    re.IGNORECASE,
+)
+
 
 class Moderator:
     """Core meeting moderator — pure logic, no TUI dependency."""
@@ -32,7 +42,7 @@ class Moderator:
         self._config = config
         self._poe = poe
         self._notes = NotesManager(poe)
-        self._shutdown = False
+        self._shutdown = asyncio.Event()
         self._labels: dict[str, str] = build_participant_labels(config.participants)
 
         self.on_chat_message = on_chat_message
@@ -45,29 +55,61 @@ class Moderator:
         return self._labels.get(name, name)
 
     def request_shutdown(self) -> None:
-        self._shutdown = True
+        self._shutdown.set()
 
     def _check_shutdown(self) -> None:
-        if self._shutdown:
+        if self._shutdown.is_set():
             raise asyncio.CancelledError("shutdown requested")
 
+    async def _until_shutdown(self, work: Coroutine[Any, Any, None]) -> None:
+        """Run work, cancelling it as soon as shutdown is requested.
+
+        This replaces a shutdown check per streamed chunk, and also stops a
+        stream that has stalled between chunks.
+        """
+        work_task = asyncio.ensure_future(work)
+        shutdown_task = asyncio.ensure_future(self._shutdown.wait())
+        try:
+            await asyncio.wait(
+                (work_task, shutdown_task), return_when=asyncio.FIRST_COMPLETED
+            )
+        except asyncio.CancelledError:
+            work_task.cancel()
+            raise
+        finally:
+            shutdown_task.cancel()
+        if not work_task.done():
+            work_task.cancel()
+            raise asyncio.CancelledError("shutdown requested")
+        work_task.result()  # re-raise any error from the work
+
+    async def _stream_reply(
+        self, session: ParticipantSession, parts: list[str]
+    ) -> None:
+        """Stream a participant's reply, collecting the chunks into parts."""
+        async for chunk in session.get_full_response():
+            parts.append(chunk)
+            await self.on_chat_chunk(session.name, chunk)
+
     async def handle_user_input(self, text: str) -> None:
         """Called when the user submits a message. Runs the full turn."""
         self._check_shutdown()
 
         # Broadcast user message to all participants
-        for session in self._poe.sessions.values():
-            session.add_user_message("User", text)
+        self._poe.broadcast_user_message("User", text)
         self._notes.add_message("User", text)
 
         # --- Phase 1: initial relevance check ---
-        await self.on_status(ModeratorState.CHECKING_RELEVANCE, "正在詢問所有 AI…")
-        results = await self._parallel_relevance_check("User", text)
-        self._check_shutdown()
-
-        # Log relevance results to notes panel
-        for r in results:
-            await self.on_note(format_relevance_result(r, self._label))
+        # (each result is logged to the notes panel as soon as it arrives)
+        if _TRIVIAL_RE.match(text.strip()):
+            await self.on_note("（簡短回應，略過相關性檢查）")
+            results: list[RelevanceResult] = []
+        else:
+            await self.on_status(
+                ModeratorState.CHECKING_RELEVANCE, "正在詢問所有 AI…"
+            )
+            results = await self._parallel_relevance_check("User", text)
+            self._check_shutdown()
 
         speakers = sort_speakers(results)
 
@@ -97,22 +139,20 @@ class Moderator:
                 f"{current.participant_name} 發言中…",
             )
 
-            # Stream the AI response
-            full_text = ""
+            # Stream the AI response (parts keeps what arrived if it fails)
+            parts: list[str] = []
             try:
-                async for chunk in session.get_full_response():
-                    self._check_shutdown()
-                    full_text += chunk
-                    await self.on_chat_chunk(current.participant_name, chunk)
+                await self._until_shutdown(self._stream_reply(session, parts))
+                full_text = "".join(parts)
             except asyncio.TimeoutError:
-                full_text += "\n（回應逾時）"
+                full_text = "".join(parts) + "\n（回應逾時）"
                 await self.on_note(
                     f"[{self._label(current.participant_name)}] 回應逾時"
                 )
             except asyncio.CancelledError:
                 raise
             except Exception as exc:
-                full_text += f"\n（錯誤：{exc!s}）"
+                full_text = "".join(parts) + f"\n（錯誤：{exc!s}）"
                 await self.on_note(
                     f"[{self._label(current.participant_name)}] 錯誤: {exc!s}"
                 )
@@ -123,19 +163,15 @@ class Moderator:
             self._notes.add_message(current.participant_name, full_text)
 
             # Broadcast to other participants
-            for name, other in self._poe.sessions.items():
-                if name != current.participant_name:
-                    other.add_other_ai_message(
-                        current.participant_name, full_text
-                    )
+            self._poe.broadcast_other_ai_message(current.participant_name, full_text)
 
             # --- Phase 3: recheck remaining candidates ---
             remaining_names = {s.participant_name for s in speakers}
             if not remaining_names:
                 # Also check those who previously said NO
-                all_names = set(self._poe.sessions.keys())
-                already_spoke = {current.participant_name}
-                remaining_names = all_names - already_spoke
+                remaining_names = {
+                    s.name for s in self._poe.iter_others(current.participant_name)
+                }
 
             if remaining_names and rounds < self._config.meeting.max_rounds_per_turn:
                 self._check_shutdown()
@@ -149,25 +185,42 @@ class Moderator:
                     full_text,
                 )
 
-                for r in recheck_results:
-                    await self.on_note(
-                        format_relevance_result(r, self._label, prefix="  ↳ ")
-                    )
-
                 speakers = sort_speakers(recheck_results)
 
         # --- Phase 4: generate round summary ---
         await self._generate_round_summary()
         await self.on_status(ModeratorState.WAITING_FOR_USER, "")
 
+    async def _collect_relevance(
+        self,
+        checks: Iterable[Awaitable[RelevanceResult]],
+        prefix: str = "",
+    ) -> list[RelevanceResult]:
+        """Run relevance checks concurrently, logging each result to the
+        notes panel as it arrives rather than after the slowest one."""
+        tasks = [asyncio.ensure_future(check) for check in checks]
+        results: list[RelevanceResult] = []
+        try:
+            for next_done in asyncio.as_completed(tasks):
+                result = await next_done
+                results.append(result)
+                await self.on_note(
+                    format_relevance_result(result, self._label, prefix=prefix)
+                )
+        finally:
+            # Unlike gather, as_completed leaves the tasks running if we're
+            # cancelled part-way through
+            for task in tasks:
+                task.cancel()
+        return results
+
     async def _parallel_relevance_check(
         self, author: str, text: str
     ) -> list[RelevanceResult]:
-        tasks = [
+        return await self._collect_relevance(
             session.check_relevance(author, text)
             for session in self._poe.sessions.values()
-        ]
-        return list(await asyncio.gather(*tasks, return_exceptions=False))
+        )
 
     async def _parallel_recheck(
         self,
@@ -175,12 +228,14 @@ class Moderator:
         speaker: str,
         message: str,
     ) -> list[RelevanceResult]:
-        tasks = [
-            self._poe.sessions[name].recheck_relevance(speaker, message)
-            for name in names
-            if name in self._poe.sessions
-        ]
-        return list(await asyncio.gather(*tasks, return_exceptions=False))
+        return await self._collect_relevance(
+            (
+                self._poe.sessions[name].recheck_relevance(speaker, message)
+                for name in names
+                if name in self._poe.sessions
+            ),
+            prefix="  ↳ ",
+        )
 
     async def _generate_round_summary(self) -> None:
         await self.on_status(ModeratorState.GENERATING_NOTES, "正在產生摘要…")
@@ -14,19 +14,17 @@ class NotesManager:
 
     def __init__(self, poe: PoeClient) -> None:
         self._poe = poe
-        self._round_messages: list[tuple[str, str]] = []  # (author, text)
+        # Formatted once on arrival, so building the prompt is a single join
+        self._round_messages: list[str] = []  # "[author]: text"
 
     def add_message(self, author: str, text: str) -> None:
-        self._round_messages.append((author, text))
+        self._round_messages.append(f"[{author}]: {text}")
 
     def clear_round(self) -> None:
         self._round_messages.clear()
 
     def _build_conversation_block(self) -> str:
-        lines: list[str] = []
-        for author, text in self._round_messages:
-            lines.append(f"[{author}]: {text}")
-        return "\n\n".join(lines)
+        return "\n\n".join(self._round_messages)
 
     async def generate_summary(self) -> str:
         if not self._round_messages:
@@ -2,20 +2,40 @@ from __future__ import annotations
 
 import asyncio
 import re
-from collections.abc import AsyncIterator
+from collections.abc import AsyncIterator, Iterator
 
-from openai import AsyncOpenAI
+from openai import AsyncOpenAI, DefaultAsyncHttpxClient, Timeout
 
 from .models import AppConfig, ParticipantConfig, RelevanceResult
 from .prompts import (
+    build_earlier_context_prompt,
     build_relevance_check_prompt,
     build_recheck_prompt,
     build_system_prompt,
 )
 
+# Well-formed replies put SUMMARY on the line after DECISION: one scan
+_PARSE_RE = re.compile(
+    r"DECISION:\s*(YES|NO)[^\n]*\n\s*SUMMARY:\s*(.+)", re.IGNORECASE
+)
 _DECISION_RE = re.compile(r"DECISION:\s*(YES|NO)", re.IGNORECASE)
 _SUMMARY_RE = re.compile(r"SUMMARY:\s*(.+)", re.IGNORECASE)
 
+# Recent messages (besides the system prompt) sent with a relevance check
+_RELEVANCE_WINDOW = 8
+
+# Recent messages sent with a full response; anything older is represented by
+# the summaries of the rounds that fell out of the window instead
+_RESPONSE_WINDOW = 40
+
+try:
+    # Lets httpx multiplex the concurrent relevance checks over one connection
+    import h2  # noqa: F401
+except ImportError:
+    _HTTP2_AVAILABLE = False
+else:
+    _HTTP2_AVAILABLE = True
+
 
 class ParticipantSession:
     """Manages conversation history and API calls for one participant."""
@@ -32,6 +52,8 @@ class ParticipantSession:
         self.participant = participant
         self.relevance_timeout = relevance_timeout
         self.response_timeout = response_timeout
+        # (len(self.messages) when the round ended, summary), oldest first
+        self.round_summaries: list[tuple[int, str]] = []
         self.messages: list[dict[str, str]] = [
             {"role": "system", "content": system_prompt},
         ]
@@ -48,19 +70,9 @@ class ParticipantSession:
     def priority(self) -> int:
         return self.participant.priority
 
-    def add_user_message(self, author: str, text: str) -> None:
-        self.messages.append(
-            {"role": "user", "content": f"[{author}]: {text}"}
-        )
-
     def add_assistant_message(self, text: str) -> None:
         self.messages.append({"role": "assistant", "content": text})
 
-    def add_other_ai_message(self, speaker: str, text: str) -> None:
-        self.messages.append(
-            {"role": "user", "content": f"[{speaker}]: {text}"}
-        )
-
     async def check_relevance(
         self, author: str, text: str
     ) -> RelevanceResult:
@@ -100,7 +112,27 @@ class ParticipantSession:
         )
 
     async def _do_relevance_call(self, prompt: str) -> RelevanceResult:
-        temp_messages = self.messages + [{"role": "user", "content": prompt}]
+        """詢問參與者是否想發言。
+
+        只附上系統提示與最近 _RELEVANCE_WINDOW 則訊息，而非完整歷史：
+        判斷是否發言只需要近期脈絡，這樣每次檢查的請求大小不會隨會議
+        長度增加。正式發言（get_full_response）使用較大的視窗，見
+        _response_messages。
+
+        Args:
+            prompt: 相關性檢查提示
+
+        Returns:
+            相關性檢查結果
+        """
+        if len(self.messages) > _RELEVANCE_WINDOW + 1:
+            temp_messages = [
+                self.messages[0],
+                *self.messages[-_RELEVANCE_WINDOW:],
+                {"role": "user", "content": prompt},
+            ]
+        else:
+            temp_messages = [*self.messages, {"role": "user", "content": prompt}]
         try:
             resp = await self._make_completion_call(
                 messages=temp_messages,
@@ -125,14 +157,20 @@ class ParticipantSession:
             )
 
     def _parse_relevance(self, text: str) -> RelevanceResult:
-        decision_match = _DECISION_RE.search(text)
-        summary_match = _SUMMARY_RE.search(text)
-        wants = (
-            decision_match.group(1).upper() == "YES"
-            if decision_match
-            else False
-        )
-        summary = summary_match.group(1).strip() if summary_match else text.strip()
+        match = _PARSE_RE.search(text)
+        if match:
+            wants = match.group(1).upper() == "YES"
+            summary = match.group(2).strip()
+        else:
+            # Loosely formatted reply: look for each field separately
+            decision_match = _DECISION_RE.search(text)
+            summary_match = _SUMMARY_RE.search(text)
+            wants = (
+                decision_match.group(1).upper() == "YES"
+                if decision_match
+                else False
+            )
+            summary = summary_match.group(1).strip() if summary_match else text.strip()
         return RelevanceResult(
             participant_name=self.name,
             wants_to_speak=wants,
@@ -140,11 +178,37 @@ class ParticipantSession:
             priority=self.priority,
         )
 
+    def _response_messages(self) -> list[dict[str, str]]:
+        """組出正式發言時送出的訊息列表。
+
+        歷史不超過 _RESPONSE_WINDOW 則時原樣送出；否則只送系統提示、
+        在最近 _RESPONSE_WINDOW 則訊息之前就已結束的各輪會議摘要，
+        以及這些最近的訊息。self.messages 本身保持完整，以便儲存。
+
+        Returns:
+            要送出的訊息列表
+        """
+        if len(self.messages) <= _RESPONSE_WINDOW + 1:
+            return self.messages
+        messages = [self.messages[0]]
+        window_start = len(self.messages) - _RESPONSE_WINDOW
+        trimmed = [
+            summary for end, summary in self.round_summaries
+            if end <= window_start
+        ]
+        if trimmed:
+            messages.append({
+                "role": "system",
+                "content": build_earlier_context_prompt(trimmed),
+            })
+        messages.extend(self.messages[-_RESPONSE_WINDOW:])
+        return messages
+
     async def get_full_response(self) -> AsyncIterator[str]:
         """Stream a full response; caller must collect chunks and call
         add_assistant_message with the complete text afterward."""
         stream = await self._make_completion_call(
-            messages=self.messages,
+            messages=self._response_messages(),
             timeout=self.response_timeout,
             stream=True,
         )
@@ -158,9 +222,18 @@ class PoeClient:
     """Top-level client managing all participant sessions."""
 
     def __init__(self, api_key: str, config: AppConfig) -> None:
+        # One pooled HTTP client shared by every session; the per-call
+        # asyncio timeouts stay in charge, this only bounds a stalled socket
+        http_client = DefaultAsyncHttpxClient(
+            http2=_HTTP2_AVAILABLE,
+            timeout=Timeout(
+                max(config.meeting.response_timeout_seconds, 90), connect=5.0
+            ),
+        )
         self._client = AsyncOpenAI(
             api_key=api_key,
             base_url=config.poe.base_url,
+            http_client=http_client,
         )
         self._notes_model = config.notes_summarizer.model
         self._config = config
@@ -174,8 +247,44 @@ class PoeClient:
                 relevance_timeout=config.meeting.relevance_timeout_seconds,
                 response_timeout=config.meeting.response_timeout_seconds,
             )
+        # Sessions are fixed after this point, so each participant's
+        # "everyone else" list can be built once
+        everyone = tuple(self.sessions.values())
+        self._others: dict[str, tuple[ParticipantSession, ...]] = {
+            name: tuple(s for s in everyone if s.name != name)
+            for name in self.sessions
+        }
+
+    def broadcast_user_message(self, author: str, text: str) -> None:
+        """Append a user message to every participant's history.
+
+        The message dict is built once and shared by all histories; entries
+        are never modified after being appended.
+        """
+        message = {"role": "user", "content": f"[{author}]: {text}"}
+        for session in self.sessions.values():
+            session.messages.append(message)
+
+    def broadcast_other_ai_message(self, speaker: str, text: str) -> None:
+        """Append a participant's finished reply to everyone else's history.
+
+        Shares one message dict like broadcast_user_message.
+        """
+        message = {"role": "user", "content": f"[{speaker}]: {text}"}
+        for session in self.iter_others(speaker):
+            session.messages.append(message)
+
+    def iter_others(self, exclude: str) -> Iterator[ParticipantSession]:
+        """Iterate over every session except the named participant's."""
+        others = self._others.get(exclude)
+        return iter(others if others is not None else self.sessions.values())
 
     async def get_notes_summary(self, prompt: str) -> str:
+        # Where the round ended in each history; the next round may start
+        # while the summary is being generated
+        round_ends = {
+            name: len(session.messages) for name, session in self.sessions.items()
+        }
         try:
             resp = await asyncio.wait_for(
                 self._client.chat.completions.create(
@@ -185,9 +294,14 @@ class PoeClient:
                 ),
                 timeout=30,
             )
-            return resp.choices[0].message.content or ""
+            summary = resp.choices[0].message.content or ""
         except Exception as exc:
             return f"（摘要產生失敗：{exc!s}）"
+        if summary:
+            # Kept as context for when the round falls out of a trimmed history
+            for name, session in self.sessions.items():
+                session.round_summaries.append((round_ends[name], summary))
+        return summary
 
     async def close(self) -> None:
         await self._client.close()
@@ -1,17 +1,38 @@
 from __future__ import annotations
 
+import functools
+from collections.abc import Iterable
+
 from .models import ParticipantConfig
 
 
 def build_system_prompt(participant: ParticipantConfig, meeting_title: str) -> str:
+    # ParticipantConfig isn't hashable, so cache on its fields
+    return _build_system_prompt(
+        participant.name,
+        participant.role,
+        participant.personality,
+        participant.description,
+        meeting_title,
+    )
+
+
+@functools.lru_cache(maxsize=64)
+def _build_system_prompt(
+    name: str,
+    role: str,
+    personality: str,
+    description: str,
+    meeting_title: str,
+) -> str:
     return (
-        f'你就是{participant.name}。你不是AI助理——你是一個真實的人，正坐在會議室裡，帶著你的經驗、觀點和態度。\n\n'
+        f'你就是{name}。你不是AI助理——你是一個真實的人，正坐在會議室裡，帶著你的經驗、觀點和態度。\n\n'
         f'會議：「{meeting_title}」\n\n'
         f"你的身份：\n"
-        f"- 姓名：{participant.name}\n"
-        f"- 職位：{participant.role}\n"
-        f"- 個性：{participant.personality}\n"
-        f"- 你的專長與職責：{participant.description}\n\n"
+        f"- 姓名：{name}\n"
+        f"- 職位：{role}\n"
+        f"- 個性：{personality}\n"
+        f"- 你的專長與職責：{description}\n\n"
         "核心準則——讓會議有價值、有深度、有趣：\n\n"
         "1. 【說話要有趣——沒人想聽無聊的發言】\n"
         "   - 用生動的比喻、故事和畫面感讓觀點令人印象深刻：「這就像在暴風雨中換引擎...」\n"
@@ -105,6 +126,13 @@ def build_recheck_prompt(
     )
 
 
+def build_earlier_context_prompt(round_summaries: Iterable[str]) -> str:
+    return (
+        "以下是這場會議較早幾輪的討論摘要，這幾輪的完整對話已不在你的上下文中：\n\n"
+        + "\n\n".join(round_summaries)
+    )
+
+
 def build_notes_prompt(conversation_block: str) -> str:
     return (
         "你是會議記錄助手。請用繁體中文將以下會議交流整理為 3-5 個簡潔的重點。"
@@ -4,14 +4,21 @@ from __future__ import annotations
 
 import asyncio
 import enum
+import functools
+import sys
+from collections.abc import Sequence
 from typing import Optional
 
-import yaml
 from openai import AsyncOpenAI
-from pydantic import ValidationError
+from pydantic import TypeAdapter, ValidationError
 
 from .models import BasicMeetingConfig, ParticipantConfig
 from .ui_helpers import clear_screen
+from .utils import load_yaml
+
+# Validates the whole participants list in one pydantic-core call; errors
+# name the offending item's index
+_PARTICIPANTS_ADAPTER = TypeAdapter(list[ParticipantConfig])
 
 
 class SetupResult(enum.Enum):
@@ -68,6 +75,30 @@ participants:
 """
 
 
+@functools.lru_cache(maxsize=8)
+def _build_setup_system_prompt(meeting_title: str, models: tuple[str, ...]) -> str:
+    # Cached so going /back and retrying with the same setup skips reformatting
+    return PARTICIPANT_SETUP_SYSTEM_PROMPT.format(
+        meeting_title=meeting_title,
+        models=", ".join(models),
+    )
+
+
+def create_planning_client(api_key: str) -> AsyncOpenAI:
+    """Create the API client used by the planning assistant.
+
+    Args:
+        api_key: POE API key
+
+    Returns:
+        A new AsyncOpenAI client; the caller is responsible for closing it
+    """
+    return AsyncOpenAI(
+        api_key=api_key,
+        base_url="https://api.poe.com/v1",
+    )
+
+
 def extract_participants_yaml(text: str) -> str | None:
     """Extract the first ```yaml ... ``` block from text.
 
@@ -77,12 +108,49 @@ def extract_participants_yaml(text: str) -> str | None:
     Returns:
         Extracted YAML string or None if not found
     """
-    if "```yaml" not in text:
-        return None
-    try:
-        return text.split("```yaml")[1].split("```")[0].strip()
-    except IndexError:
+    start = text.find("```yaml")
+    if start < 0:
         return None
+    start += len("```yaml")
+    end = text.find("```", start)
+    # An unterminated block runs to the end of the text
+    return text[start:end if end >= 0 else None].strip()
+
+
+def _yaml_block_complete(text: str) -> bool:
+    """Check whether text already holds a ```yaml block and its closing fence.
+
+    Args:
+        text: Response text received so far
+
+    Returns:
+        True once the block can be extracted in full
+    """
+    start = text.find("```yaml")
+    return start >= 0 and text.find("```", start + len("```yaml")) >= 0
+
+
+def _validate_business_rules(participants: list[ParticipantConfig]) -> str | None:
+    """Check rules the schema can't express: unique names and priorities.
+
+    Args:
+        participants: Schema-validated participants
+
+    Returns:
+        Error message for the first rule broken, or None if all rules pass
+    """
+    seen_names: set[str] = set()
+    seen_priorities: set[int] = set()
+
+    # Either duplicate rejects the whole design, so stop at the first one
+    for p in participants:
+        if p.name in seen_names:
+            return f"參與者名稱重複：{p.name}"
+        seen_names.add(p.name)
+        if p.priority in seen_priorities:
+            return f"發言優先級重複：{p.priority}"
+        seen_priorities.add(p.priority)
+    return None
 
 
 def parse_participants(yaml_str: str) -> list[ParticipantConfig] | None:
@@ -95,16 +163,19 @@ def parse_participants(yaml_str: str) -> list[ParticipantConfig] | None:
         List of ParticipantConfig or None if validation fails
     """
     try:
-        raw = yaml.safe_load(yaml_str)
+        raw = load_yaml(yaml_str)
         if not isinstance(raw, dict) or "participants" not in raw:
             print("  驗證錯誤：YAML 必須包含 'participants' 鍵")
             return None
 
-        participants = [
-            ParticipantConfig.model_validate(p) for p in raw["participants"]
-        ]
+        participants = _PARTICIPANTS_ADAPTER.validate_python(raw["participants"])
+
+        error = _validate_business_rules(participants)
+        if error:
+            print(f"  驗證錯誤：{error}")
+            return None
         return participants
-    except (ValidationError, yaml.YAMLError, KeyError, TypeError) as exc:
+    except (ValidationError, ValueError, KeyError, TypeError) as exc:
         print(f"  驗證錯誤：{exc}")
         return None
 
@@ -112,8 +183,9 @@ def parse_participants(yaml_str: str) -> list[ParticipantConfig] | None:
 async def run_participant_setup(
     basic_config: BasicMeetingConfig,
     api_key: str,
-    available_models: list[str],
-    planning_assistant_model: str = "gemini-3-pro"
+    available_models: Sequence[str],
+    planning_assistant_model: str = "gemini-3-pro",
+    client: Optional[AsyncOpenAI] = None,
 ) -> tuple[SetupResult, Optional[list[ParticipantConfig]]]:
     """Run participant design with AI assistance.
 
@@ -122,6 +194,8 @@ async def run_participant_setup(
         api_key: POE API key
         available_models: List of available model names
         planning_assistant_model: Model to use for planning assistant
+        client: Client to reuse (left open); if None, one is created for
+            this run and closed afterwards
 
     Returns:
         Tuple of (SetupResult, Optional[list[ParticipantConfig]])
@@ -151,14 +225,12 @@ async def run_participant_setup(
     print("  /quit   - 離開程式")
     print()
 
-    client = AsyncOpenAI(
-        api_key=api_key,
-        base_url="https://api.poe.com/v1",
-    )
+    owns_client = client is None
+    if client is None:
+        client = create_planning_client(api_key)
 
-    system_prompt = PARTICIPANT_SETUP_SYSTEM_PROMPT.format(
-        meeting_title=basic_config.title,
-        models=", ".join(available_models)
+    system_prompt = _build_setup_system_prompt(
+        basic_config.title, tuple(available_models)
     )
     messages: list[dict[str, str]] = [
         {"role": "system", "content": system_prompt},
@@ -205,12 +277,26 @@ async def run_participant_setup(
                     stream=True,
                 )
                 print(f"\n{planning_assistant_model}: ", end="", flush=True)
-                full_response = ""
+                parts: list[str] = []
+                write, flush = sys.stdout.write, sys.stdout.flush
                 async for chunk in stream:
                     delta = chunk.choices[0].delta
                     if delta.content:
-                        print(delta.content, end="", flush=True)
-                        full_response += delta.content
+                        # Still flushed per chunk so the reply appears as it streams
+                        write(delta.content)
+                        flush()
+                        parts.append(delta.content)
+                        # For /start the YAML block is all we need, so stop
+                        # reading once it closes rather than wait for any
+                        # trailing remarks (only checked when a fence may end)
+                        if (
+                            requesting_start
+                            and "`" in delta.content
+                            and _yaml_block_complete("".join(parts))
+                        ):
+                            break
+                await stream.close()
+                full_response = "".join(parts)
                 print("\n")
                 messages.append({
                     "role": "assistant",
@@ -244,4 +330,5 @@ async def run_participant_setup(
                 return SetupResult.SUCCESS, participants
 
     finally:
-        await client.close()
+        if owns_client:
+            await client.close()
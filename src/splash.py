@@ -1,5 +1,6 @@
 """Animated splash screen for AI Meeting Room using Rich."""
 
+import sys
 import time
 
 from rich import box
@@ -32,6 +33,9 @@ GRADIENT_COLORS = [
     "#00d7ff",
 ]
 
+# Gradient styles built once rather than per line on every frame
+_GRADIENT_STYLES = [Style(color=color, bold=True) for color in GRADIENT_COLORS]
+
 # Block-letter ASCII art lines (without border characters)
 ART_LINES = [
     r" █████╗ ██╗    ███╗   ███╗███████╗███████╗████████╗██╗███╗   ██╗ ██████╗ ",
@@ -70,8 +74,7 @@ def _build_art_text(lines: list[str], num_lines: int | None = None) -> Text:
 
     for i in range(total):
         if i < visible:
-            color = GRADIENT_COLORS[i % len(GRADIENT_COLORS)]
-            text.append(lines[i], style=Style(color=color, bold=True))
+            text.append(lines[i], style=_GRADIENT_STYLES[i % len(_GRADIENT_STYLES)])
         else:
             # Blank line to maintain panel dimensions during reveal
             text.append(" " * len(lines[i]))
@@ -123,11 +126,17 @@ def _animate_reveal(console: Console, duration: float) -> None:
     num_lines = len(ART_LINES)
     delay = duration / num_lines
 
+    # Build every frame up front so the loop only swaps them in
+    frames = [
+        # Don't show info text until all lines revealed
+        _build_splash_panel(
+            _build_art_text(ART_LINES, num_lines=i), show_info=(i == num_lines)
+        )
+        for i in range(1, num_lines + 1)
+    ]
+
     with Live(console=console, refresh_per_second=20, transient=True) as live:
-        for i in range(1, num_lines + 1):
-            art_text = _build_art_text(ART_LINES, num_lines=i)
-            # Don't show info text until all lines revealed
-            panel = _build_splash_panel(art_text, show_info=(i == num_lines))
+        for panel in frames:
             live.update(panel)
             time.sleep(delay)
 
@@ -153,7 +162,9 @@ def _animate_progress(console: Console, duration: float) -> None:
 
     with progress:
         task = progress.add_task(LOADING_TEXT, total=100)
-        steps = 50
+        # Progress only redraws 10 times a second, so more steps than this
+        # would mostly be updates nobody sees
+        steps = 25
         step_delay = duration / steps
         for i in range(steps):
             progress.update(task, advance=100 / steps)
@@ -166,6 +177,11 @@ def display_splash_screen(duration: float = 2.0) -> None:
     Args:
         duration: Total display duration in seconds.
     """
+    # Piped or redirected output (logs, CI): nobody sees the animation
+    if not sys.stdout.isatty():
+        print(f"{SUBTITLE} 版本 {__version__}")
+        return
+
     try:
         clear_screen()
         console = Console()
@@ -1,19 +1,25 @@
 """UI helper functions for interactive prompts and displays."""
 
 import os
+import sys
 from typing import Any, Callable, TypeVar
 
 T = TypeVar('T')
 
+# What `clear` prints: cursor home, clear screen, clear scrollback
+_CLEAR_SEQUENCE = "\x1b[H\x1b[2J\x1b[3J"
+
 
 def clear_screen() -> None:
     """Clear the terminal screen."""
-    # Windows
+    # Windows (the console may not have ANSI escape support enabled)
     if os.name == 'nt':
         os.system('cls')
-    # Unix/Linux/Mac
-    else:
-        os.system('clear')
+    # Unix/Linux/Mac: write the escape codes directly instead of spawning
+    # a shell to run `clear`; skipped when output is piped or redirected
+    elif sys.stdout.isatty():
+        sys.stdout.write(_CLEAR_SEQUENCE)
+        sys.stdout.flush()
 
 
 def print_phase_header(phase: int, title: str) -> None:
@@ -122,11 +128,13 @@ def print_config_summary(config: Any) -> None:
     Args:
         config: BasicMeetingConfig object
     """
-    print("\n" + "-" * 50)
-    print("設定摘要：")
-    print("-" * 50)
-    print(f"  會議標題：{config.title}")
-    print(f"  每輪最大回合數：{config.max_rounds_per_turn}")
-    print(f"  相關性逾時：{config.relevance_timeout_seconds}s")
-    print(f"  回應逾時：{config.response_timeout_seconds}s")
-    print("-" * 50 + "\n")
+    print("\n".join([
+        "\n" + "-" * 50,
+        "設定摘要：",
+        "-" * 50,
+        f"  會議標題：{config.title}",
+        f"  每輪最大回合數：{config.max_rounds_per_turn}",
+        f"  相關性逾時：{config.relevance_timeout_seconds}s",
+        f"  回應逾時：{config.response_timeout_seconds}s",
+        "-" * 50 + "\n",
+    ]))
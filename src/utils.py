@@ -1,12 +1,89 @@
 from __future__ import annotations
 
+import functools
+import json
+import os
 from collections.abc import Callable
-from typing import TYPE_CHECKING
+from datetime import datetime, timezone
+from operator import attrgetter
+from typing import TYPE_CHECKING, Any
+
+try:
+    import orjson
+except ImportError:  # 選用套件，未安裝時使用標準函式庫 json
+    orjson = None
 
 if TYPE_CHECKING:
+    from pathlib import Path
+
+    from pydantic import BaseModel
+
     from .models import ParticipantConfig, RelevanceResult
 
 
+def utc_now_iso() -> str:
+    """回傳目前 UTC 時間的 ISO 8601 字串（精確到秒，含時區）。"""
+    return datetime.now(timezone.utc).isoformat(timespec="seconds")
+
+
+def atomic_write_bytes(path: Path, data: bytes) -> None:
+    """先寫入同目錄的暫存檔，再以 os.replace 取代目標檔案。
+
+    寫入途中中斷時，原檔案保持完整，不會留下寫到一半的內容。
+    """
+    tmp_path = path.with_name(path.name + ".tmp")
+    with open(tmp_path, "wb") as f:
+        f.write(data)
+    os.replace(tmp_path, path)
+
+
+def dump_json(data: Any) -> bytes:
+    """將資料序列化為縮排的 UTF-8 JSON 位元組（有 orjson 時優先使用）。"""
+    if orjson is not None:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2)
+    return json.dumps(data, ensure_ascii=False, indent=2).encode("utf-8")
+
+
+def dump_model_json(model: BaseModel) -> bytes:
+    """將 Pydantic 模型序列化為縮排的 UTF-8 JSON 位元組。
+
+    有 orjson 時經由 dict 交給 orjson（實測最快）；否則直接使用 Pydantic
+    內建的序列化器，省去 dict 轉換，也比標準函式庫 json 快。
+    """
+    if orjson is not None:
+        return orjson.dumps(model.model_dump(), option=orjson.OPT_INDENT_2)
+    return model.model_dump_json(indent=2).encode("utf-8")
+
+
+def load_json(raw: bytes) -> Any:
+    """解析 JSON 位元組（有 orjson 時優先使用）。格式錯誤時拋出 ValueError。"""
+    if orjson is not None:
+        return orjson.loads(raw)
+    return json.loads(raw)
+
+
+@functools.lru_cache(maxsize=1)
+def yaml_safe_loader() -> type:
+    """回傳 PyYAML 的 SafeLoader（有 libyaml 時使用 C 版本）。
+
+    只有讀取舊版檔案與規劃助手的回應時才需要 PyYAML，因此延後到第一次
+    呼叫才匯入，不拖慢程式啟動。
+    """
+    import yaml
+
+    return getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
+
+def load_yaml(stream: Any) -> Any:
+    """解析 YAML 字串或檔案（見 yaml_safe_loader）。格式錯誤時拋出 ValueError。"""
+    import yaml
+
+    try:
+        return yaml.load(stream, Loader=yaml_safe_loader())
+    except yaml.YAMLError as exc:
+        raise ValueError(str(exc)) from exc
+
+
 def format_participant_label(participant: ParticipantConfig) -> str:
     """格式化參與者標籤為 'Name（Role, Model）' 格式。"""
     return f"{participant.name}（{participant.role}, {participant.model}）"
@@ -19,12 +96,18 @@ def build_participant_labels(
     return {p.name: format_participant_label(p) for p in participants}
 
 
+_by_priority = attrgetter("priority")
+
+
 def sort_speakers(results: list[RelevanceResult]) -> list[RelevanceResult]:
     """過濾想發言的參與者並按優先級排序。"""
-    return sorted(
-        [r for r in results if r.wants_to_speak],
-        key=lambda r: r.priority,
-    )
+    speakers = [r for r in results if r.wants_to_speak]
+    speakers.sort(key=_by_priority)
+    return speakers
+
+
+# Indexed by RelevanceResult.wants_to_speak (False → 0, True → 1)
+_RELEVANCE_TAGS = ("NO", "YES")
 
 
 def format_relevance_result(
@@ -40,6 +123,7 @@ def format_relevance_result(
     Returns:
         格式化的日誌字串
     """
-    tag = "YES" if result.wants_to_speak else "NO"
-    label = label_func(result.participant_name)
-    return f"{prefix}[{label}] {tag}: {result.summary}"
+    return (
+        f"{prefix}[{label_func(result.participant_name)}] "
+        f"{_RELEVANCE_TAGS[result.wants_to_speak]}: {result.summary}"
+    )
@@ -0,0 +1,63 @@
+"""Restoring a saved meeting into the chat panel."""
+
+import unittest
+
+from src.app import _CHAT_MAX_LINES, MeetingApp
+from src.conversation_storage import ConversationData, ConversationMessage, SessionData
+from src.models import AppConfig, ParticipantConfig
+
+
+def _make_session(messages: list[ConversationMessage]) -> SessionData:
+    config = AppConfig(
+        participants=[
+            ParticipantConfig(
+                name="A",
+                role="r",
+                personality="p",
+                description="d",
+                model="gpt-4o",
+                priority=1,
+            )
+        ]
+    )
+    return SessionData(
+        session_id="test",
+        title="test",
+        created_at="2024-01-01T00:00:00+00:00",
+        updated_at="2024-01-01T00:00:00+00:00",
+        config=config,
+        conversation=ConversationData(chat_display=messages),
+    )
+
+
+class RestoreConversationTest(unittest.IsolatedAsyncioTestCase):
+    async def _restored_chat(self, messages: list[ConversationMessage]) -> str:
+        session = _make_session(messages)
+        app = MeetingApp(session.config, "test-key", session.session_id, session)
+        async with app.run_test():
+            text = app._chat_panel.text
+            line_count = app._chat_panel.document.line_count
+        self.assertLessEqual(line_count, _CHAT_MAX_LINES)
+        return text
+
+    async def test_long_session_stays_within_line_cap(self) -> None:
+        messages = [
+            ConversationMessage(author="A", text=f"第 {i} 則\n第二行", timestamp="")
+            for i in range(2000)
+        ]
+        text = await self._restored_chat(messages)
+        self.assertIn("較早的訊息未顯示", text)
+        self.assertIn("第 1999 則", text)
+
+    async def test_short_session_is_restored_in_full(self) -> None:
+        messages = [
+            ConversationMessage(author="使用者", text=f"訊息 {i}", timestamp="")
+            for i in range(10)
+        ]
+        text = await self._restored_chat(messages)
+        self.assertNotIn("較早的訊息未顯示", text)
+        self.assertIn("訊息 0", text)
+
+
+if __name__ == "__main__":
+    unittest.main()
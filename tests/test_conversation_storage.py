@@ -0,0 +1,76 @@
+"""Loading sessions saved in the old YAML format."""
+
+import tempfile
+import unittest
+from pathlib import Path
+from unittest import mock
+
+import yaml
+
+from src import conversation_storage
+from src.conversation_storage import ConversationData, ConversationMessage, SessionData
+from src.models import AppConfig, ParticipantConfig
+
+
+def _write_legacy_session(conv_dir: Path) -> Path:
+    config = AppConfig(
+        participants=[
+            ParticipantConfig(
+                name="A",
+                role="r",
+                personality="p",
+                description="d",
+                model="gpt-4o",
+                priority=1,
+            )
+        ]
+    )
+    session = SessionData(
+        session_id="legacy",
+        title="舊會議",
+        created_at="2024-01-01T00:00:00+00:00",
+        updated_at="2024-01-01T00:00:00+00:00",
+        config=config,
+        conversation=ConversationData(
+            chat_display=[ConversationMessage(author="A", text="你好", timestamp="")]
+        ),
+    )
+    path = conv_dir / "legacy.yaml"
+    path.write_text(
+        yaml.safe_dump(session.model_dump(mode="json"), allow_unicode=True),
+        encoding="utf-8",
+    )
+    return path
+
+
+class LoadLegacyConversationTest(unittest.TestCase):
+    def setUp(self) -> None:
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        self.conv_dir = Path(tmp.name)
+        patcher = mock.patch.object(
+            conversation_storage, "get_conversations_dir", return_value=self.conv_dir
+        )
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        self.legacy_path = _write_legacy_session(self.conv_dir)
+
+    def test_legacy_session_is_converted_to_json(self) -> None:
+        session = conversation_storage.load_conversation("legacy")
+        self.assertIsNotNone(session)
+        self.assertEqual(session.title, "舊會議")
+        self.assertTrue((self.conv_dir / "legacy.json").exists())
+        self.assertFalse(self.legacy_path.exists())
+
+    def test_legacy_session_loads_when_conversion_fails(self) -> None:
+        with mock.patch.object(
+            conversation_storage, "atomic_write_bytes", side_effect=PermissionError
+        ):
+            session = conversation_storage.load_conversation("legacy")
+        self.assertIsNotNone(session)
+        self.assertEqual(session.conversation.chat_display[0].text, "你好")
+        self.assertTrue(self.legacy_path.exists())
+
+
+if __name__ == "__main__":
+    unittest.main()
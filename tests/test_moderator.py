@@ -0,0 +1,19 @@
+"""Which user messages skip the relevance round."""
+
+import unittest
+
+from src.moderator import _TRIVIAL_RE
+
+
+class TrivialMessageTest(unittest.TestCase):
+    def test_thanks_is_trivial(self) -> None:
+        for text in ("謝謝！", "多謝", "Thanks.", "thank you!", "thx"):
+            self.assertTrue(_TRIVIAL_RE.match(text), text)
+
+    def test_affirmatives_are_not_trivial(self) -> None:
+        for text in ("好", "好的", "了解", "明白", "收到", "ok", "got it", "👍", "嗯"):
+            self.assertIsNone(_TRIVIAL_RE.match(text), text)
+
+
+if __name__ == "__main__":
+    unittest.main()